@@ -5,6 +5,8 @@ const SkillSystem = (function() {
 
     // Private variables
     let skillsData = {};
+    let skillOptions = {}; // Presorted <option> fragments from libs/skill_options.json
+    let skillOptionsFingerprints = {};
 
     // Public API
     return {
@@ -84,7 +86,8 @@ const SkillSystem = (function() {
                     }
                 });
                 
-                await Promise.all(loadPromises);
+                await Promise.all([...loadPromises, this.loadSkillOptions()]);
+                this.verifySkillOptions();
                 console.log('✅ All skills data loaded successfully');
                 
             } catch (error) {
@@ -145,6 +148,60 @@ const SkillSystem = (function() {
             }
         },
 
+        /**
+         * Load presorted option fragments built by libs/scripts/build_skill_options.py
+         * Falls back to runtime sorting in updateSkillOptions if unavailable
+         */
+        async loadSkillOptions() {
+            try {
+                const response = await fetch('./libs/skill_options.json');
+                if (response.ok) {
+                    const optionsData = await response.json();
+                    for (const [color, options] of Object.entries(optionsData.colors)) {
+                        skillOptions[color] = options.html;
+                        skillOptionsFingerprints[color] = options.fingerprint;
+                    }
+                    console.log(`✓ Loaded presorted skill options (skills v${optionsData.skills_version})`);
+                } else {
+                    console.warn('⚠️  Could not load skill_options.json, sorting at runtime');
+                }
+            } catch (err) {
+                console.warn('⚠️  Error loading skill options, sorting at runtime:', err);
+            }
+        },
+
+        /**
+         * Drop presorted fragments that no longer match the loaded skill files
+         * (e.g. build_skill_options.py was not re-run after an edit)
+         */
+        verifySkillOptions() {
+            for (const color of Object.keys(skillOptions)) {
+                if (!skillsData[color] || this.skillsFingerprint(skillsData[color]) !== skillOptionsFingerprints[color]) {
+                    console.warn(`⚠️  skill_options.json is stale for ${color}, sorting at runtime`);
+                    delete skillOptions[color];
+                }
+            }
+        },
+
+        /**
+         * FNV-1a (32-bit) over id, name, check type and score of each skill
+         * Must match skills_fingerprint in libs/scripts/build_skill_options.py
+         * @param {Array} skills - Skills of one color in file order
+         * @returns {string} - 8-digit hex fingerprint
+         */
+        skillsFingerprint(skills) {
+            let hash = 0x811c9dc5;
+            for (const skill of skills) {
+                const checkType = skill.check_type || skill['check-type'] || '';
+                const text = `${skill.id || ''}|${skill.name}|${checkType}|${JSON.stringify(skill.score)}\n`;
+                for (let i = 0; i < text.length; i++) {
+                    hash ^= text.charCodeAt(i);
+                    hash = Math.imul(hash, 0x01000193) >>> 0;
+                }
+            }
+            return hash.toString(16).padStart(8, '0');
+        },
+
         /**
          * Add a new skill row
          */
@@ -207,6 +264,12 @@ const SkillSystem = (function() {
          * @param {string} color - The skill color
          */
         updateSkillOptions(skillSelect, color) {
+            // Use presorted fragment - no sorting or serialization at runtime
+            if (skillOptions[color] !== undefined) {
+                skillSelect.innerHTML = '<option value="">Select a skill...</option>' + skillOptions[color];
+                return;
+            }
+            
             skillSelect.innerHTML = '<option value="">Select a skill...</option>';
             
             if (skillsData[color]) {
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Script to pack Uma avatar thumbnails into one WebP sprite atlas
+Writes assets/sprites/atlas.webp and the coordinate index assets/data/sprites.json
+
+Build-side only: the calculator page loads just the selected avatar (the picker
+is a native <select>), so the outputs are not committed or loaded by the client
+
+Only rebuilds when a source image or a setting changed; use --force to always rebuild
+Requires Pillow with WebP support: pip install Pillow
+"""
+
+import hashlib
+import json
+import os
+import sys
+from datetime import datetime
+from typing import Dict, List, Any, Tuple
+
+try:
+    from PIL import Image
+except ImportError:
+    print("❌ Error: Pillow is required. Install it with: pip install Pillow")
+    sys.exit(1)
+
+INDEX_VERSION = 1
+THUMB_SIZE = 128
+WEBP_QUALITY = 80
+ATLAS_MAX_WIDTH = 1024
+PADDING = 2
+
+ATLAS_FILE = 'assets/sprites/atlas.webp'
+INDEX_FILE = 'assets/data/sprites.json'
+UMA_DATA_FILE = 'assets/data/uma_musume.json'
+
+
+def collect_sources(root_dir: str) -> List[str]:
+    """List the avatar of every Uma in uma_musume.json, paths relative to root_dir"""
+    with open(os.path.join(root_dir, UMA_DATA_FILE), 'r', encoding='utf-8') as f:
+        uma_data = json.load(f)
+
+    sources = []
+    seen = set()
+    for uma in uma_data['uma_musume']:
+        image = uma.get('image')
+        if image and image not in seen:
+            if not os.path.exists(os.path.join(root_dir, image)):
+                print(f"⚠️  Warning: {image} not found, skipping {uma['name']}")
+                continue
+            sources.append(image)
+            seen.add(image)
+
+    return sources
+
+
+def hash_sources(root_dir: str, sources: List[str]) -> Dict[str, str]:
+    """SHA-1 of each source file, used to detect changes"""
+    hashes = {}
+    for image in sources:
+        with open(os.path.join(root_dir, image), 'rb') as f:
+            hashes[image] = hashlib.sha1(f.read()).hexdigest()
+    return hashes
+
+
+def is_up_to_date(root_dir: str, source_hashes: Dict[str, str], settings: Dict[str, Any]) -> bool:
+    """True if the existing index was built from the same sources and settings"""
+    index_path = os.path.join(root_dir, INDEX_FILE)
+    if not os.path.exists(index_path) or not os.path.exists(os.path.join(root_dir, ATLAS_FILE)):
+        return False
+
+    with open(index_path, 'r', encoding='utf-8') as f:
+        index_data = json.load(f)
+
+    return (index_data.get('version') == INDEX_VERSION and
+            index_data.get('settings') == settings and
+            index_data.get('sources') == source_hashes)
+
+
+def pack_shelves(sizes: List[Tuple[int, int]], max_width: int) -> Tuple[List[Tuple[int, int]], int, int]:
+    """
+    Shelf-pack rectangles, tallest first
+
+    Returns:
+        (positions in input order, atlas width, atlas height)
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    positions = [(0, 0)] * len(sizes)
+
+    x = y = shelf_height = width = 0
+    for i in order:
+        w, h = sizes[i]
+        if x > 0 and x + w > max_width:
+            y += shelf_height + PADDING
+            x = shelf_height = 0
+        positions[i] = (x, y)
+        x += w + PADDING
+        shelf_height = max(shelf_height, h)
+        width = max(width, x - PADDING)
+
+    return positions, width, y + shelf_height
+
+
+def load_sprite(path: str) -> Image.Image:
+    """Open an avatar as RGBA, downscaled to THUMB_SIZE"""
+    image = Image.open(path).convert('RGBA')
+    image.thumbnail((THUMB_SIZE, THUMB_SIZE), Image.LANCZOS)
+    return image
+
+
+def build_atlas(root_dir: str, force: bool = False) -> bool:
+    """Build atlas.webp and sprites.json, skipping if nothing changed"""
+    sources = collect_sources(root_dir)
+    if not sources:
+        print("❌ Error: No source images found!")
+        return False
+
+    settings = {
+        'thumb_size': THUMB_SIZE,
+        'quality': WEBP_QUALITY,
+        'max_width': ATLAS_MAX_WIDTH,
+        'padding': PADDING
+    }
+
+    print(f"📖 Found {len(sources)} source images")
+    source_hashes = hash_sources(root_dir, sources)
+
+    if not force and is_up_to_date(root_dir, source_hashes, settings):
+        print("✓ Atlas is up to date, nothing to do")
+        return True
+
+    sprites = [load_sprite(os.path.join(root_dir, image)) for image in sources]
+    positions, width, height = pack_shelves([s.size for s in sprites], ATLAS_MAX_WIDTH)
+
+    atlas = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+    for sprite, position in zip(sprites, positions):
+        atlas.paste(sprite, position)
+
+    atlas_path = os.path.join(root_dir, ATLAS_FILE)
+    os.makedirs(os.path.dirname(atlas_path), exist_ok=True)
+    atlas.save(atlas_path, 'WEBP', quality=WEBP_QUALITY, method=6)
+
+    with open(atlas_path, 'rb') as f:
+        atlas_hash = hashlib.sha1(f.read()).hexdigest()[:10]
+
+    index_data = {
+        'version': INDEX_VERSION,
+        'generated': datetime.now().strftime("%Y-%m-%d"),
+        'atlas': {
+            'file': ATLAS_FILE,
+            'hash': atlas_hash,
+            'width': width,
+            'height': height
+        },
+        'sprites': {
+            image: {'x': x, 'y': y, 'w': sprite.width, 'h': sprite.height}
+            for image, sprite, (x, y) in zip(sources, sprites, positions)
+        },
+        'settings': settings,
+        'sources': source_hashes
+    }
+
+    with open(os.path.join(root_dir, INDEX_FILE), 'w', encoding='utf-8') as f:
+        json.dump(index_data, f, indent=2, ensure_ascii=False)
+
+    print(f"💾 Atlas: {ATLAS_FILE} ({width}x{height}, {os.path.getsize(atlas_path) // 1024} KB)")
+    print(f"💾 Index: {INDEX_FILE}")
+
+    return True
+
+
+if __name__ == "__main__":
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    root_dir = os.path.dirname(os.path.dirname(script_dir))
+    force = '--force' in sys.argv[1:]
+
+    print("=" * 60)
+    print("Build Avatar Atlas → atlas.webp + sprites.json")
+    print("=" * 60)
+    print()
+
+    success = build_atlas(root_dir, force)
+    exit(0 if success else 1)
@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Script to encode/decode compact shareable build codes
+Converts the StorageManager JSON state into a short URL-safe code and back
+
+Build code layout (version 1), before URL-safe base64 without padding:
+    byte     version
+    varint   uma id (0 = no Uma selected)
+    varint   speed, stamina, power, guts, wisdom
+    4 bytes  10 aptitude tiers (2 bits each), star rating (3 bits),
+             unique skill level (3 bits), big-endian
+    varint   skill count
+    varint   per skill: (number << 3) | color index  (e.g. golden_012)
+"""
+
+import base64
+import functools
+import json
+import os
+import re
+import sys
+import time
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+
+BUILD_CODE_VERSION = 1
+
+# Wire order - never reorder, only append (code stores the index)
+SKILL_COLORS = ['ius', 'golden', 'yellow', 'red', 'green', 'blue', 'purple']
+APTITUDE_KEYS = ['turf', 'dirt', 'sprint', 'mile', 'medium', 'long', 'front', 'pace', 'late', 'end']
+APTITUDE_TIERS = ['S-A', 'B-C', 'D-E-F', 'G']
+
+# Same defaults as StorageManager.saveState
+DEFAULT_APTITUDES = {
+    'turf': 'S-A', 'dirt': 'G', 'sprint': 'B-C', 'mile': 'B-C', 'medium': 'S-A',
+    'long': 'S-A', 'front': 'S-A', 'pace': 'S-A', 'late': 'D-E-F', 'end': 'G'
+}
+
+# Legacy single-letter aptitudes (still accepted by SkillSystem.getRatingLevelFromDiv7)
+LEGACY_TIERS = {
+    'S': 'S-A', 'A': 'S-A', 'B': 'B-C', 'C': 'B-C', 'D': 'D-E-F', 'E': 'D-E-F', 'F': 'D-E-F'
+}
+
+_TIER_INDEX = {tier: i for i, tier in enumerate(APTITUDE_TIERS)}
+_COLOR_INDEX = {color: i for i, color in enumerate(SKILL_COLORS)}
+
+
+def skill_slug(name: str) -> str:
+    """Same slug as SkillSystem option values: name.toLowerCase().replace(/\\s+/g, '-')"""
+    return re.sub(r'\s+', '-', name.lower())
+
+
+def load_skill_slugs(libs_dir: str) -> Dict[str, str]:
+    """Map skill slug -> skill id from libs/skills_index.json"""
+    with open(os.path.join(libs_dir, 'skills_index.json'), 'r', encoding='utf-8') as f:
+        index_data = json.load(f)
+
+    slugs = {}
+    for color in index_data['colors']:
+        file_info = index_data['files'][color]
+        file_name = file_info['file'] if isinstance(file_info, dict) else file_info
+        with open(os.path.join(libs_dir, file_name), 'r', encoding='utf-8') as f:
+            for skill in json.load(f):
+                slugs.setdefault(skill_slug(skill['name']), skill['id'])
+    return slugs
+
+
+def _write_varint(out: bytearray, value: int):
+    if value < 0:
+        raise ValueError(f"Varint value must be >= 0, got {value}")
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """Read a varint at pos, returns (value, next pos)"""
+    value = shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("Truncated build code")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _pack_skill_id(skill_id: str) -> int:
+    color, _, number = skill_id.rpartition('_')
+    if color not in _COLOR_INDEX or not number.isdigit():
+        raise ValueError(f"Invalid skill id '{skill_id}'")
+    return (int(number) << 3) | _COLOR_INDEX[color]
+
+
+# Bounded: values come from untrusted codes; real ids number a few hundred
+@functools.lru_cache(maxsize=4096)
+def _unpack_skill_id(value: int) -> str:
+    color_index = value & 0x7
+    if color_index >= len(SKILL_COLORS):
+        raise ValueError(f"Invalid skill color index {color_index}")
+    return f"{SKILL_COLORS[color_index]}_{str(value >> 3).zfill(3)}"
+
+
+def encode_build(build: Dict[str, Any]) -> str:
+    """
+    Encode a build dict into a build code
+
+    Args:
+        build: {'uma_id', 'stats', 'aptitudes', 'star_rating', 'unique_level', 'skills'}
+               as returned by decode_build_code / build_from_state
+    """
+    stats = build['stats']
+    if len(stats) != 5:
+        raise ValueError(f"Expected 5 stats, got {len(stats)}")
+
+    star = build['star_rating']
+    unique_level = build['unique_level']
+    if not 0 <= star <= 7 or not 0 <= unique_level <= 7:
+        raise ValueError(f"Star rating/unique level out of range: {star}/{unique_level}")
+
+    out = bytearray([BUILD_CODE_VERSION])
+    _write_varint(out, build['uma_id'] or 0)
+    for stat in stats:
+        _write_varint(out, stat)
+
+    packed = 0
+    for key in APTITUDE_KEYS:
+        tier = build['aptitudes'].get(key, DEFAULT_APTITUDES[key])
+        if tier not in _TIER_INDEX:
+            raise ValueError(f"Invalid aptitude '{key}': {tier}")
+        packed = (packed << 2) | _TIER_INDEX[tier]
+    packed = (packed << 6) | (star << 3) | unique_level
+    out += packed.to_bytes(4, 'big')
+
+    _write_varint(out, len(build['skills']))
+    for skill_id in build['skills']:
+        _write_varint(out, _pack_skill_id(skill_id))
+
+    return base64.urlsafe_b64encode(bytes(out)).rstrip(b'=').decode('ascii')
+
+
+def decode_build_code(code: str) -> Dict[str, Any]:
+    """Decode a build code into a build dict, raising ValueError if malformed"""
+    data = base64.urlsafe_b64decode(code + '=' * (-len(code) % 4))
+    if not data or data[0] != BUILD_CODE_VERSION:
+        raise ValueError(f"Unsupported build code version: {data[0] if data else None}")
+
+    pos = 1
+    values = []
+    # uma id + 5 stats
+    for _ in range(6):
+        value, pos = _read_varint(data, pos)
+        values.append(value)
+
+    if pos + 4 > len(data):
+        raise ValueError("Truncated build code")
+    packed = int.from_bytes(data[pos:pos + 4], 'big')
+    pos += 4
+    aptitudes = {}
+    shift = 24
+    for key in APTITUDE_KEYS:
+        aptitudes[key] = APTITUDE_TIERS[(packed >> shift) & 0x3]
+        shift -= 2
+
+    count, pos = _read_varint(data, pos)
+    skills = []
+    for _ in range(count):
+        value, pos = _read_varint(data, pos)
+        skills.append(_unpack_skill_id(value))
+
+    if pos != len(data):
+        raise ValueError(f"{len(data) - pos} unexpected trailing byte(s) in build code")
+
+    return {
+        'uma_id': values[0] or None,
+        'stats': values[1:],
+        'aptitudes': aptitudes,
+        'star_rating': (packed >> 3) & 0x7,
+        'unique_level': packed & 0x7,
+        'skills': skills
+    }
+
+
+def _state_int(value: Any, name: str) -> int:
+    """Coerce a numeric state field (stored as number or string) to int"""
+    try:
+        return int(float(value or 0))
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError(f"Invalid {name}: {value!r}")
+
+
+def build_from_state(state: Dict[str, Any], skill_slugs: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Convert a StorageManager JSON state into a build dict
+    Raises ValueError for anything encode_build would reject, like decode_build_code
+
+    Args:
+        state: Parsed umaCalculatorState from localStorage
+        skill_slugs: Slug -> skill id mapping from load_skill_slugs
+    """
+    if not isinstance(state, dict):
+        raise ValueError(f"Expected a JSON object, got {type(state).__name__}")
+
+    state_aptitudes = state.get('aptitudes') or {}
+    if not isinstance(state_aptitudes, dict):
+        raise ValueError("Invalid aptitudes: expected an object")
+    aptitudes = dict(DEFAULT_APTITUDES)
+    for key in APTITUDE_KEYS:
+        tier = state_aptitudes.get(key, aptitudes[key])
+        if isinstance(tier, str):
+            tier = LEGACY_TIERS.get(tier, tier)
+        if not isinstance(tier, str) or tier not in _TIER_INDEX:
+            raise ValueError(f"Invalid aptitude '{key}': {tier}")
+        aptitudes[key] = tier
+
+    stats = state.get('stats') or [0] * 5
+    if not isinstance(stats, list) or len(stats) != 5:
+        raise ValueError("Expected 5 stats")
+    stats = [_state_int(value, 'stat') for value in stats]
+    if any(stat < 0 for stat in stats):
+        raise ValueError(f"Stats must be >= 0, got {stats}")
+
+    star = _state_int(state.get('starRating'), 'star rating')
+    unique_level = _state_int(state.get('uniqueSkillLevel') or 1, 'unique skill level')
+    if not 0 <= star <= 7 or not 0 <= unique_level <= 7:
+        raise ValueError(f"Star rating/unique level out of range: {star}/{unique_level}")
+
+    uma_id = _state_int(state.get('selectedUmaId'), 'Uma id')
+    if uma_id < 0:
+        raise ValueError(f"Invalid Uma id: {uma_id}")
+
+    state_skills = state.get('skills') or []
+    if not isinstance(state_skills, list):
+        raise ValueError("Invalid skills: expected a list")
+
+    skills = []
+    for skill in state_skills:
+        if not isinstance(skill, dict):
+            raise ValueError(f"Invalid skill entry: {skill!r}")
+        slug = skill.get('skillId')
+        if not slug:
+            continue
+        if not isinstance(slug, str) or slug not in skill_slugs:
+            raise ValueError(f"Unknown skill '{slug}'")
+        skills.append(skill_slugs[slug])
+
+    return {
+        'uma_id': uma_id or None,
+        'stats': stats,
+        'aptitudes': aptitudes,
+        'star_rating': star,
+        'unique_level': unique_level,
+        'skills': skills
+    }
+
+
+def parse_build(text: str, skill_slugs: Dict[str, str]) -> Dict[str, Any]:
+    """Parse either a build code or a legacy JSON state (fallback)"""
+    text = text.strip()
+    if text.startswith('{'):
+        return build_from_state(json.loads(text), skill_slugs)
+    return decode_build_code(text)
+
+
+def parse_archive_line(line: str, line_num: int,
+                       skill_slugs: Dict[str, str]) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """
+    Parse one build archive line: '<code>' or '<build_id>\t<code>'
+    (a JSON state may stand in for the code); shared by every archive reader
+
+    Returns:
+        (build id, build), the id defaulting to the line number, or None for a blank line
+    """
+    line = line.strip()
+    if not line:
+        return None
+
+    build_id, sep, text = line.partition('\t')
+    if not sep or line[0] == '{':
+        build_id, text = str(line_num), line
+    return build_id, parse_build(text, skill_slugs)
+
+
+def read_archive(lines: Iterable[str], skill_slugs: Dict[str, str],
+                 skipped: Optional[List[int]] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Read (build id, build) pairs from build archive lines
+    Blank lines are ignored; malformed lines are reported and skipped
+
+    Args:
+        skipped: Optional list that receives the line numbers of skipped lines
+    """
+    for line_num, line in enumerate(lines, start=1):
+        try:
+            entry = parse_archive_line(line, line_num, skill_slugs)
+        except ValueError as e:
+            print(f"⚠️  Warning: Skipping line {line_num}: {e}")
+            if skipped is not None:
+                skipped.append(line_num)
+            continue
+        if entry is not None:
+            yield entry
+
+
+def decode_many(lines: Iterable[str], skill_slugs: Dict[str, str],
+                skipped: Optional[List[int]] = None) -> Iterator[Dict[str, Any]]:
+    """Decode build codes (or JSON states) line by line, see read_archive"""
+    for _, build in read_archive(lines, skill_slugs, skipped):
+        yield build
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("Usage:")
+        print("  Encode: python build_codes.py encode <state.json>")
+        print("  Decode: python build_codes.py decode <code>")
+        print("  Bulk:   python build_codes.py bulk <codes.txt> [output.jsonl]")
+        print()
+        print("state.json is the umaCalculatorState value saved by StorageManager")
+        print("Bulk input has one build code (or JSON state) per line, optionally '<build_id>\\t<code>'")
+        sys.exit(1)
+
+    command = sys.argv[1].lower()
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    libs_dir = os.path.dirname(script_dir)
+
+    if command == 'encode':
+        with open(sys.argv[2], 'r', encoding='utf-8') as f:
+            build = build_from_state(json.load(f), load_skill_slugs(libs_dir))
+        print(encode_build(build))
+
+    elif command == 'decode':
+        print(json.dumps(decode_build_code(sys.argv[2]), indent=2, ensure_ascii=False))
+
+    elif command == 'bulk':
+        output_file = sys.argv[3] if len(sys.argv) > 3 else None
+        skill_slugs = load_skill_slugs(libs_dir)
+
+        start = time.perf_counter()
+        count = 0
+        skipped = []
+        with open(sys.argv[2], 'r', encoding='utf-8') as f_in:
+            f_out = open(output_file, 'w', encoding='utf-8') if output_file else None
+            try:
+                for build in decode_many(f_in, skill_slugs, skipped):
+                    count += 1
+                    if f_out:
+                        f_out.write(json.dumps(build, ensure_ascii=False) + '\n')
+            finally:
+                if f_out:
+                    f_out.close()
+        elapsed = time.perf_counter() - start
+
+        print(f"✅ Decoded {count} builds in {elapsed:.2f}s")
+        if skipped:
+            print(f"⊘ Skipped {len(skipped)} malformed line(s)")
+        if output_file:
+            print(f"💾 Written to {output_file}")
+
+    else:
+        print(f"Error: Unknown command '{command}'. Use 'encode', 'decode' or 'bulk'")
+        sys.exit(1)
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Python port of the calculator scoring rules for offline/batch use
+Mirrors js/calculator.js, js/skillSystem.js, js/aptitudeSystem.js,
+js/uniqueSkill.js and js/overallScore.js - keep them in sync
+"""
+
+import json
+import math
+import os
+from typing import Dict, Any, Optional
+
+from build_codes import APTITUDE_KEYS
+
+# js/calculator.js
+BLOCK_SIZE = 50
+MULTIPLIERS = [
+    0.5, 0.8, 1, 1.3, 1.6, 1.8, 2.1, 2.4, 2.6, 2.8, 2.9, 3, 3.1, 3.3, 3.4,
+    3.5, 3.9, 4.1, 4.2, 4.3, 5.2, 5.5, 6.6, 6.8, 6.9
+]
+
+# js/overallScore.js (highest first)
+RATING_THRESHOLDS = [
+    (19200, 'SS+'), (17500, 'SS'), (15900, 'S+'), (14500, 'S'),
+    (12100, 'A+'), (10000, 'A'), (8200, 'B+'), (6500, 'B'),
+    (4900, 'C+'), (3500, 'C'), (2900, 'D+'), (2300, 'D'),
+    (1800, 'E+'), (1300, 'E'), (900, 'F+'), (600, 'F'),
+    (300, 'G+'), (0, 'G')
+]
+RATINGS = [rating for _, rating in RATING_THRESHOLDS]
+
+# js/skillSystem.js getRatingLevelFromDiv7 / js/aptitudeSystem.js getAptitudeMultiplier
+TIER_LEVELS = {'S-A': 'good', 'B-C': 'average', 'D-E-F': 'bad', 'G': 'terrible'}
+TIER_MULTIPLIERS = {'S-A': 1.0, 'B-C': 0.8, 'D-E-F': 0.6, 'G': 0.5}
+
+
+def js_round(value: float) -> int:
+    """Math.round (halves round up, unlike Python's round)"""
+    return math.floor(value + 0.5)
+
+
+def calculate_stat_score(stat_value: int) -> int:
+    """Calculator.calculateStatScore"""
+    if stat_value < 0:
+        return 0
+
+    blocks = stat_value // BLOCK_SIZE
+    block_sum = 0
+    for i in range(min(blocks, len(MULTIPLIERS))):
+        block_sum += MULTIPLIERS[i] * BLOCK_SIZE
+
+    remainder = stat_value % BLOCK_SIZE
+    next_multiplier = MULTIPLIERS[blocks] if blocks < len(MULTIPLIERS) else MULTIPLIERS[-1]
+    remainder_sum = next_multiplier * (remainder + 1)
+
+    return math.floor(block_sum + remainder_sum)
+
+
+def get_check_type(skill: Dict[str, Any]) -> str:
+    """Support both new format (check_type) and old format (check-type)"""
+    return skill.get('check_type') or skill.get('check-type') or ''
+
+
+def skill_aptitude_key(check_type: str) -> Optional[str]:
+    """Aptitude field used for a skill's rating level and multiplier, if any"""
+    check_type = check_type.lower()
+    if not check_type:
+        return None
+    if check_type in APTITUDE_KEYS:
+        return check_type
+    # AptitudeSystem.getSkillAptitudeMultiplier matches by substring
+    for key in APTITUDE_KEYS:
+        if key in check_type:
+            return key
+    return None
+
+
+def calculate_skill_score(skill: Dict[str, Any], tier: Optional[str]) -> int:
+    """
+    SkillSystem.updateSkillScore for one skill
+
+    Args:
+        skill: Skill entry from skills/<color>.json
+        tier: Aptitude tier (S-A/B-C/D-E-F/G) of the skill's check type, None if unrelated
+    """
+    score = skill.get('score', 0)
+    check_type = get_check_type(skill)
+
+    if isinstance(score, dict) and check_type:
+        level = TIER_LEVELS.get(tier, 'good')
+        final_score = score.get(level) or score.get('base') or score.get('good') or 0
+        multiplier = TIER_MULTIPLIERS.get(tier, 1.0)
+        if multiplier != 1.0:
+            final_score = js_round(final_score * multiplier)
+        return final_score
+    if isinstance(score, dict):
+        return score.get('base') or score.get('good') or 0
+    if isinstance(score, (int, float)):
+        return score
+    return 0
+
+
+def calculate_unique_skill_score(star_level: int, skill_level: int) -> int:
+    """UniqueSkill.getUniqueSkillScore"""
+    if star_level <= 2:
+        return skill_level * 120
+    return skill_level * 170
+
+
+def calculate_build_score(build: Dict[str, Any], skills_by_id: Dict[str, Dict[str, Any]]) -> int:
+    """OverallScore.updateOverallScore for a decoded build (see build_codes.py)"""
+    total = sum(calculate_stat_score(stat) for stat in build['stats'])
+
+    aptitudes = build['aptitudes']
+    for skill_id in build['skills']:
+        skill = skills_by_id.get(skill_id)
+        if skill is None:
+            continue  # Removed skill scores 0
+        key = skill_aptitude_key(get_check_type(skill))
+        total += calculate_skill_score(skill, aptitudes.get(key) if key else None)
+
+    total += calculate_unique_skill_score(build['star_rating'], build['unique_level'])
+    return total
+
+
+def get_rating(overall_score: int) -> str:
+    """OverallScore.updateOverallRating"""
+    for minimum, rating in RATING_THRESHOLDS:
+        if overall_score >= minimum:
+            return rating
+    return 'G'
+
+
+def load_skills_by_id(libs_dir: str) -> Dict[str, Dict[str, Any]]:
+    """Load every skill from a libs directory (skills_index.json + color files) keyed by id"""
+    with open(os.path.join(libs_dir, 'skills_index.json'), 'r', encoding='utf-8') as f:
+        index_data = json.load(f)
+
+    skills_by_id = {}
+    for color in index_data['colors']:
+        file_info = index_data['files'][color]
+        file_name = file_info['file'] if isinstance(file_info, dict) else file_info
+        file_path = os.path.join(libs_dir, file_name)
+        if not os.path.exists(file_path):
+            continue
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for skill in json.load(f):
+                skills_by_id[skill['id']] = skill
+    return skills_by_id
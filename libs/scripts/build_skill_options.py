@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Script to build presorted skill option lists for the skill dropdowns
+Generates skill_options.json so SkillSystem.updateSkillOptions does no
+sorting or JSON.stringify at runtime
+
+Run after any edit of skills/*.json (import_from_tsv.py runs it automatically);
+the client ignores a color whose fingerprint no longer matches its skills file
+"""
+
+import html
+import json
+import os
+import unicodedata
+from datetime import datetime
+from typing import Dict, List, Any, Tuple
+
+from build_codes import skill_slug
+
+OUTPUT_VERSION = 2
+
+
+def collation_key(name: str) -> Tuple[Tuple[int, str], ...]:
+    """
+    Approximate name.localeCompare(other, 'en', { sensitivity: 'base' })
+    Case and accents are ignored; spaces < punctuation < symbols < digits < letters
+    """
+    key = []
+    for char in unicodedata.normalize('NFKD', name):
+        category = unicodedata.category(char)
+        if category.startswith('M'):
+            continue  # accents / combining marks
+        if category.startswith('Z'):
+            group = 0
+        elif category.startswith('P'):
+            group = 1
+        elif category.startswith('S'):
+            group = 2
+        elif category.startswith('N'):
+            group = 3
+        else:
+            group = 4
+        key.append((group, char.casefold()))
+    return tuple(key)
+
+
+def build_option_html(skill: Dict[str, Any]) -> str:
+    """Render one <option> exactly like SkillSystem.updateSkillOptions does"""
+    # Support both new format (check_type) and old format (check-type)
+    check_type = skill.get('check_type') or skill.get('check-type') or ''
+    score = json.dumps(skill['score'], separators=(',', ':'), ensure_ascii=False)
+
+    attrs = [
+        f'value="{html.escape(skill_slug(skill["name"]))}"',
+        f'data-score="{html.escape(score)}"',
+        f'data-check-type="{html.escape(check_type)}"'
+    ]
+    if skill.get('id'):
+        attrs.append(f'data-skill-id="{html.escape(skill["id"])}"')
+
+    return f'<option {" ".join(attrs)}>{html.escape(skill["name"], quote=False)}</option>'
+
+
+def skills_fingerprint(skills: List[Dict[str, Any]]) -> str:
+    """
+    FNV-1a (32-bit) over id, name, check type and score of each skill in file order
+    Must match SkillSystem.skillsFingerprint, which hashes UTF-16 code units
+    """
+    text = ''.join(
+        f"{skill.get('id', '')}|{skill['name']}|{skill.get('check_type') or skill.get('check-type') or ''}|"
+        f"{json.dumps(skill['score'], separators=(',', ':'), ensure_ascii=False)}\n"
+        for skill in skills
+    )
+    data = text.encode('utf-16-le')
+
+    h = 0x811c9dc5
+    for i in range(0, len(data), 2):
+        h ^= data[i] | (data[i + 1] << 8)
+        h = (h * 0x01000193) & 0xFFFFFFFF
+    return f"{h:08x}"
+
+
+def build_color_options(skills: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Sort one color's skills and render the option fragment (only what the client reads)"""
+    sorted_skills = sorted(skills, key=lambda s: (collation_key(s['name']), s['name']))
+
+    return {
+        'fingerprint': skills_fingerprint(skills),
+        'html': ''.join(build_option_html(skill) for skill in sorted_skills)
+    }
+
+
+def build_skill_options(libs_dir: str, output_file: str) -> bool:
+    """Build skill_options.json from the color files listed in skills_index.json"""
+    index_file = os.path.join(libs_dir, 'skills_index.json')
+
+    if not os.path.exists(index_file):
+        print(f"❌ Error: {index_file} not found!")
+        return False
+
+    with open(index_file, 'r', encoding='utf-8') as f:
+        index_data = json.load(f)
+
+    print(f"📖 Reading skills from version {index_data['version']}")
+
+    options = {
+        'version': OUTPUT_VERSION,
+        'skills_version': index_data['version'],
+        'generated': datetime.now().strftime("%Y-%m-%d"),
+        'colors': {}
+    }
+
+    for color in index_data['colors']:
+        file_info = index_data['files'][color]
+        file_name = file_info['file'] if isinstance(file_info, dict) else file_info
+        file_path = os.path.join(libs_dir, file_name)
+
+        if not os.path.exists(file_path):
+            print(f"⚠️  Warning: {file_path} not found, skipping {color}")
+            continue
+
+        with open(file_path, 'r', encoding='utf-8') as f:
+            skills = json.load(f)
+
+        options['colors'][color] = build_color_options(skills)
+        print(f"✓ Sorted {len(skills)} {color} skills")
+
+    # Fetched on every page load, so written compactly
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(options, f, separators=(',', ':'), ensure_ascii=False)
+
+    print(f"\n✅ Options written to: {output_file}")
+    return True
+
+
+if __name__ == "__main__":
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    libs_dir = os.path.dirname(script_dir)
+    output_file = os.path.join(libs_dir, 'skill_options.json')
+
+    print("=" * 60)
+    print("Build Skill Options → skill_options.json")
+    print("=" * 60)
+    print()
+
+    success = build_skill_options(libs_dir, output_file)
+    exit(0 if success else 1)
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Script to rescore only the saved builds affected by a skills data change
+Keeps an inverted index (skill id -> builds, aptitude tier -> builds) in a
+sqlite file next to the build archive and diffs two versions of libs/skills
+
+Archive format: one build per line, either '<code>' or '<build_id>\\t<code>'
+(legacy JSON states are accepted in place of a code, see build_codes.py)
+"""
+
+import os
+import sqlite3
+import sys
+from typing import Dict, List, Any, Optional, Set
+
+from build_codes import (
+    APTITUDE_KEYS, APTITUDE_TIERS, encode_build, decode_build_code, load_skill_slugs, parse_archive_line
+)
+from build_scoring import (
+    RATINGS, calculate_build_score, calculate_skill_score, get_check_type, get_rating,
+    load_skills_by_id, skill_aptitude_key
+)
+
+INDEX_VERSION = 2
+
+
+def diff_skills(old_skills: Dict[str, Dict[str, Any]],
+                new_skills: Dict[str, Dict[str, Any]]) -> Dict[str, Optional[Set[str]]]:
+    """
+    Find skills whose score changed between two versions
+
+    Returns:
+        skill id -> aptitude index keys ('late:G') whose score changed, or None if
+        every build holding the skill is affected (added/removed skill, check type
+        change, or a skill without an aptitude check)
+    """
+    changed = {}
+
+    for skill_id in old_skills.keys() | new_skills.keys():
+        old_skill = old_skills.get(skill_id)
+        new_skill = new_skills.get(skill_id)
+
+        if old_skill is None or new_skill is None:
+            changed[skill_id] = None
+            continue
+        if old_skill.get('score') == new_skill.get('score') and \
+                get_check_type(old_skill) == get_check_type(new_skill):
+            continue
+
+        old_key = skill_aptitude_key(get_check_type(old_skill))
+        if old_key is None or old_key != skill_aptitude_key(get_check_type(new_skill)):
+            changed[skill_id] = None
+            continue
+
+        keys = {
+            f"{old_key}:{tier}" for tier in APTITUDE_TIERS
+            if calculate_skill_score(old_skill, tier) != calculate_skill_score(new_skill, tier)
+        }
+        if keys:
+            changed[skill_id] = keys
+
+    return changed
+
+
+class BuildIndex:
+    """
+    Inverted index over a build archive, stored in sqlite as <archive>.index.sqlite
+    Postings are keyed by skill id / aptitude tier, so a rescore only reads the
+    changed skills' holders and the affected builds' rows; writes are transactional
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+        CREATE TABLE IF NOT EXISTS builds (
+            id INTEGER PRIMARY KEY, build_id TEXT NOT NULL UNIQUE,
+            code TEXT NOT NULL, score INTEGER NOT NULL, rating TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS skill_postings (
+            skill_id TEXT NOT NULL, id INTEGER NOT NULL, PRIMARY KEY (skill_id, id)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS aptitude_postings (
+            aptitude TEXT NOT NULL, id INTEGER NOT NULL, PRIMARY KEY (aptitude, id)
+        ) WITHOUT ROWID;
+    """
+
+    def __init__(self, archive_file: str):
+        self.archive_file = archive_file
+        self.index_file = archive_file + '.index.sqlite'
+        self.db = None
+        self.offset = 0
+        self.line_count = 0
+        self.build_count = 0
+
+    def load(self) -> bool:
+        """Open (or create) the index, returns False if it was missing or outdated"""
+        existed = os.path.exists(self.index_file)
+        self.db = sqlite3.connect(self.index_file)
+        self.db.executescript(self.SCHEMA)
+
+        meta = dict(self.db.execute("SELECT key, value FROM meta"))
+        if existed and meta.get('version') == INDEX_VERSION:
+            self.offset = meta['offset']
+            self.line_count = meta['line_count']
+            self.build_count = meta['build_count']
+            return True
+
+        self.clear()
+        return False
+
+    def clear(self):
+        """Drop every indexed build"""
+        for table in ('builds', 'skill_postings', 'aptitude_postings'):
+            self.db.execute(f"DELETE FROM {table}")
+        self.offset = 0
+        self.line_count = 0
+        self.build_count = 0
+
+    def save(self):
+        """Commit pending changes (atomic: an interrupted run leaves the last committed index)"""
+        self.db.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [('version', INDEX_VERSION), ('offset', self.offset), ('line_count', self.line_count),
+             ('build_count', self.build_count)]
+        )
+        self.db.commit()
+
+    def close(self):
+        self.db.close()
+
+    def add_build(self, build_id: str, build: Dict[str, Any], skills_by_id: Dict[str, Dict[str, Any]]):
+        """Index one build and store its current score"""
+        self.remove_build(build_id)
+
+        score = calculate_build_score(build, skills_by_id)
+        row_id = self.db.execute(
+            "INSERT INTO builds (build_id, code, score, rating) VALUES (?, ?, ?, ?)",
+            (build_id, encode_build(build), score, get_rating(score))
+        ).lastrowid
+        self._write_postings("INSERT", row_id, build)
+        self.build_count += 1
+
+    def remove_build(self, build_id: str):
+        """Drop a build from the index"""
+        row = self.db.execute("SELECT id, code FROM builds WHERE build_id = ?", (build_id,)).fetchone()
+        if row is None:
+            return
+
+        row_id, code = row
+        # The stored code says which postings to delete, so no build_id index is needed
+        self._write_postings("DELETE", row_id, decode_build_code(code))
+        self.db.execute("DELETE FROM builds WHERE id = ?", (row_id,))
+        self.build_count -= 1
+
+    def _write_postings(self, action: str, row_id: int, build: Dict[str, Any]):
+        """Insert or delete a build's skill and aptitude postings"""
+        if action == "INSERT":
+            skill_sql = "INSERT INTO skill_postings (skill_id, id) VALUES (?, ?)"
+            aptitude_sql = "INSERT INTO aptitude_postings (aptitude, id) VALUES (?, ?)"
+        else:
+            skill_sql = "DELETE FROM skill_postings WHERE skill_id = ? AND id = ?"
+            aptitude_sql = "DELETE FROM aptitude_postings WHERE aptitude = ? AND id = ?"
+
+        self.db.executemany(skill_sql, [(skill_id, row_id) for skill_id in set(build['skills'])])
+        self.db.executemany(
+            aptitude_sql, [(f"{key}:{build['aptitudes'][key]}", row_id) for key in APTITUDE_KEYS]
+        )
+
+    def update(self, skills_by_id: Dict[str, Dict[str, Any]], skill_slugs: Dict[str, str]) -> int:
+        """
+        Index lines appended to the archive since the last update
+        The archive is append-only; a shrunk archive triggers a full rebuild
+
+        Returns:
+            Number of builds indexed
+        """
+        if os.path.getsize(self.archive_file) < self.offset:
+            print("⚠️  Archive shrank since last index, rebuilding...")
+            self.clear()
+
+        added = 0
+        with open(self.archive_file, 'rb') as f:
+            f.seek(self.offset)
+            for raw_line in f:
+                if not raw_line.endswith(b'\n'):
+                    break  # Partially written line, pick it up next time
+                self.offset += len(raw_line)
+                self.line_count += 1
+
+                try:
+                    entry = parse_archive_line(raw_line.decode('utf-8'), self.line_count, skill_slugs)
+                    if entry is None:
+                        continue
+                    self.add_build(*entry, skills_by_id)
+                except ValueError as e:
+                    # Skipped for good: the offset still moves past the line
+                    print(f"⚠️  Warning: Skipping line {self.line_count}: {e}")
+                    continue
+                added += 1
+
+        return added
+
+    def affected_builds(self, changed: Dict[str, Optional[Set[str]]]) -> Set[int]:
+        """Row ids of builds whose score may change, given diff_skills output"""
+        affected = set()
+
+        for skill_id, keys in changed.items():
+            if keys is None:
+                rows = self.db.execute(
+                    "SELECT id FROM skill_postings WHERE skill_id = ?", (skill_id,)
+                )
+            else:
+                # Walks the skill's holders and probes the aptitude postings by primary key
+                keys = sorted(keys)
+                rows = self.db.execute(
+                    "SELECT s.id FROM skill_postings s "
+                    "JOIN aptitude_postings a ON a.id = s.id "
+                    f"AND a.aptitude IN ({', '.join('?' * len(keys))}) "
+                    "WHERE s.skill_id = ?",
+                    (*keys, skill_id)
+                )
+            affected.update(row_id for row_id, in rows)
+
+        return affected
+
+    def rescore(self, changed: Dict[str, Optional[Set[str]]],
+                new_skills: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Recompute scores for affected builds only and record rating changes
+
+        Args:
+            changed: diff_skills output for the old and new skills data
+            new_skills: New skills data, keyed by id
+
+        Returns:
+            One entry per affected build: build id, old/new score and rating
+        """
+        results = []
+        for row_id in sorted(self.affected_builds(changed)):
+            build_id, code, old_score, old_rating = self.db.execute(
+                "SELECT build_id, code, score, rating FROM builds WHERE id = ?", (row_id,)
+            ).fetchone()
+            score = calculate_build_score(decode_build_code(code), new_skills)
+            rating = get_rating(score)
+            results.append({
+                'build_id': build_id,
+                'old_score': old_score,
+                'new_score': score,
+                'old_rating': old_rating,
+                'new_rating': rating
+            })
+            self.db.execute(
+                "UPDATE builds SET score = ?, rating = ? WHERE id = ?", (score, rating, row_id)
+            )
+
+        return results
+
+
+def print_report(changed: Dict[str, Optional[Set[str]]],
+                 results: Optional[List[Dict[str, Any]]] = None, total_builds: int = 0):
+    """Print changed skills and, after a rescore, rating moves"""
+    print(f"\n{'='*60}")
+    print("IMPACT REPORT")
+    print(f"{'='*60}")
+    print(f"🔍 Changed skills: {len(changed)}")
+    for skill_id in sorted(changed):
+        keys = changed[skill_id]
+        print(f"   {skill_id}: {'all holders' if keys is None else ', '.join(sorted(keys))}")
+
+    if results is None:
+        print(f"{'='*60}\n")
+        return
+
+    print(f"\n📊 Rescored {len(results)} of {total_builds} builds")
+
+    moved = [r for r in results if r['old_rating'] != r['new_rating']]
+    up = sum(1 for r in moved if RATINGS.index(r['new_rating']) < RATINGS.index(r['old_rating']))
+    print(f"⬆ Rating up: {up}")
+    print(f"⬇ Rating down: {len(moved) - up}")
+
+    for r in moved:
+        print(f"   {r['build_id']}: {r['old_rating']} → {r['new_rating']} "
+              f"({r['old_score']} → {r['new_score']})")
+    print(f"{'='*60}\n")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("Usage:")
+        print("  Index:   python impact_analysis.py index <archive>")
+        print("  Diff:    python impact_analysis.py diff <old_libs_dir> [new_libs_dir]")
+        print("  Rescore: python impact_analysis.py rescore <archive> <old_libs_dir> [new_libs_dir]")
+        print()
+        print("new_libs_dir defaults to the current libs/ directory")
+        print("old_libs_dir is a copy of libs/ before the change (skills_index.json + skills/)")
+        sys.exit(1)
+
+    command = sys.argv[1].lower()
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    libs_dir = os.path.dirname(script_dir)
+
+    if command == 'index':
+        index = BuildIndex(sys.argv[2])
+        index.load()
+        added = index.update(load_skills_by_id(libs_dir), load_skill_slugs(libs_dir))
+        index.save()
+        print(f"✅ Indexed {added} new builds ({index.build_count} total)")
+        index.close()
+
+    elif command == 'diff':
+        new_dir = sys.argv[3] if len(sys.argv) > 3 else libs_dir
+        changed = diff_skills(load_skills_by_id(sys.argv[2]), load_skills_by_id(new_dir))
+        print_report(changed)
+
+    elif command == 'rescore':
+        if len(sys.argv) < 4:
+            print("Error: Rescore requires <archive> and <old_libs_dir>")
+            sys.exit(1)
+
+        new_dir = sys.argv[4] if len(sys.argv) > 4 else libs_dir
+        old_skills = load_skills_by_id(sys.argv[3])
+        new_skills = load_skills_by_id(new_dir)
+
+        index = BuildIndex(sys.argv[2])
+        if not index.load():
+            # Scores of a fresh index must come from the old data
+            print("📖 No index found, indexing archive with old skills data...")
+            index.update(old_skills, load_skill_slugs(sys.argv[3]))
+
+        changed = diff_skills(old_skills, new_skills)
+        results = index.rescore(changed, new_skills)
+        # New lines since the last index are scored with the new data
+        index.update(new_skills, load_skill_slugs(new_dir))
+        index.save()
+
+        print_report(changed, results, index.build_count)
+        index.close()
+
+    else:
+        print(f"Error: Unknown command '{command}'. Use 'index', 'diff' or 'rescore'")
+        sys.exit(1)
@@ -10,6 +10,8 @@ import csv
 from datetime import datetime
 from typing import Dict, List, Any
 
+from build_skill_options import build_skill_options
+
 def read_tsv(tsv_file: str) -> List[Dict[str, Any]]:
     """Read TSV file and return list of skill data"""
     skills = []
@@ -211,6 +213,12 @@ def update_skills_from_tsv(tsv_file: str, color: str, json_file: str, mode: str
     print(f"{'='*60}\n")
     
     print("✅ Import completed successfully!")
+    
+    # Keep presorted dropdown options in sync with the updated skills
+    libs_dir = os.path.dirname(os.path.dirname(os.path.abspath(json_file)))
+    print("\n🔤 Rebuilding skill_options.json...")
+    build_skill_options(libs_dir, os.path.join(libs_dir, 'skill_options.json'))
+    
     print("\n💡 Next steps:")
     print(f"   1. Review {json_file}")
     print(f"   2. Run: python validate_skills.py")
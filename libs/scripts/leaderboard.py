@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+Script to rank scored builds against each other
+Keeps scores in sorted, bisect-able lists (overall plus optional per-Uma and
+per-rating partitions) so inserts, updates, rank and percentile queries are
+O(log n); snapshots are saved to a JSON file
+
+Scores use build_scoring.py (same rules as OverallScore.updateOverallScore)
+"""
+
+import bisect
+import json
+import math
+import os
+import sys
+from typing import Dict, List, Any, Optional, Tuple
+
+from build_codes import load_skill_slugs, parse_build, read_archive
+from build_scoring import RATINGS, calculate_build_score, get_rating, load_skills_by_id
+
+SNAPSHOT_VERSION = 1
+
+Entry = Tuple[int, str]  # (score, build_id)
+
+
+class SortedScores:
+    """
+    Sorted list of (score, build_id) split into sublists of about LOAD items
+    Bisect on sublist maxima finds the sublist; a Fenwick tree over sublist
+    lengths turns positions into ranks and back in O(log n)
+    """
+
+    LOAD = 500
+
+    def __init__(self, entries: Optional[List[Entry]] = None):
+        entries = sorted(entries or [])
+        self._lists = [entries[i:i + self.LOAD] for i in range(0, len(entries), self.LOAD)]
+        self._maxes = [sub[-1] for sub in self._lists]
+        self._len = len(entries)
+        self._build_tree()
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _build_tree(self):
+        tree = [0] + [len(sub) for sub in self._lists]
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _tree_add(self, pos: int, delta: int):
+        pos += 1
+        while pos < len(self._tree):
+            self._tree[pos] += delta
+            pos += pos & -pos
+
+    def _tree_prefix(self, pos: int) -> int:
+        """Number of items in sublists before pos"""
+        total = 0
+        while pos > 0:
+            total += self._tree[pos]
+            pos -= pos & -pos
+        return total
+
+    def _tree_find(self, index: int) -> Tuple[int, int]:
+        """(sublist, offset) holding the item at index"""
+        pos = 0
+        step = 1 << (len(self._tree).bit_length())
+        while step:
+            nxt = pos + step
+            if nxt < len(self._tree) and self._tree[nxt] <= index:
+                index -= self._tree[nxt]
+                pos = nxt
+            step >>= 1
+        return pos, index
+
+    def add(self, entry: Entry):
+        if not self._maxes:
+            self._lists.append([entry])
+            self._maxes.append(entry)
+            self._len = 1
+            self._build_tree()
+            return
+
+        pos = bisect.bisect_left(self._maxes, entry)
+        if pos == len(self._maxes):
+            pos -= 1
+            self._lists[pos].append(entry)
+            self._maxes[pos] = entry
+        else:
+            bisect.insort(self._lists[pos], entry)
+        self._len += 1
+
+        if len(self._lists[pos]) > 2 * self.LOAD:
+            sub = self._lists[pos]
+            self._lists[pos:pos + 1] = [sub[:self.LOAD], sub[self.LOAD:]]
+            self._maxes[pos:pos + 1] = [sub[self.LOAD - 1], sub[-1]]
+            self._build_tree()
+        else:
+            self._tree_add(pos, 1)
+
+    def remove(self, entry: Entry):
+        pos = bisect.bisect_left(self._maxes, entry)
+        if pos == len(self._maxes):
+            raise ValueError(f"{entry} not in list")
+        sub = self._lists[pos]
+        idx = bisect.bisect_left(sub, entry)
+        if idx == len(sub) or sub[idx] != entry:
+            raise ValueError(f"{entry} not in list")
+
+        del sub[idx]
+        self._len -= 1
+        if not sub:
+            del self._lists[pos]
+            del self._maxes[pos]
+            self._build_tree()
+        else:
+            self._maxes[pos] = sub[-1]
+            self._tree_add(pos, -1)
+
+    def bisect_left(self, entry: Entry) -> int:
+        """Number of items < entry"""
+        pos = bisect.bisect_left(self._maxes, entry)
+        if pos == len(self._maxes):
+            return self._len
+        return self._tree_prefix(pos) + bisect.bisect_left(self._lists[pos], entry)
+
+    def __getitem__(self, index: int) -> Entry:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("SortedScores index out of range")
+        pos, offset = self._tree_find(index)
+        return self._lists[pos][offset]
+
+    def iter_descending(self):
+        """Yield items from the highest score down"""
+        for sub in reversed(self._lists):
+            yield from reversed(sub)
+
+
+class Leaderboard:
+    """
+    Scored builds ranked overall and, optionally, per Uma and per rating
+
+    Partition names: 'all', 'uma:<uma_id>', 'rating:<rating>'
+    """
+
+    def __init__(self, partition_by_uma: bool = True, partition_by_rating: bool = True):
+        self.partition_by_uma = partition_by_uma
+        self.partition_by_rating = partition_by_rating
+        self.entries: Dict[str, Tuple[int, Optional[int]]] = {}
+        self.partitions: Dict[str, SortedScores] = {'all': SortedScores()}
+
+    def _partition_names(self, score: int, uma_id: Optional[int]) -> List[str]:
+        names = ['all']
+        if self.partition_by_uma and uma_id is not None:
+            names.append(f"uma:{uma_id}")
+        if self.partition_by_rating:
+            names.append(f"rating:{get_rating(score)}")
+        return names
+
+    def upsert(self, build_id: str, score: int, uma_id: Optional[int] = None):
+        """Insert a build or move it to its new score"""
+        if build_id in self.entries:
+            self.remove(build_id)
+
+        self.entries[build_id] = (score, uma_id)
+        for name in self._partition_names(score, uma_id):
+            self.partitions.setdefault(name, SortedScores()).add((score, build_id))
+
+    def remove(self, build_id: str):
+        """Drop a build from every partition"""
+        score, uma_id = self.entries.pop(build_id)
+        for name in self._partition_names(score, uma_id):
+            self.partitions[name].remove((score, build_id))
+
+    def _partition(self, partition: str) -> SortedScores:
+        return self.partitions.get(partition) or SortedScores()
+
+    def rank(self, build_id: str, partition: str = 'all') -> int:
+        """1-based rank from the top; ties share the best rank"""
+        score, uma_id = self.entries[build_id]
+        if partition not in self._partition_names(score, uma_id):
+            raise ValueError(f"Build '{build_id}' is not in partition '{partition}'")
+        scores = self._partition(partition)
+        # Sort key (score, build_id) puts ties in id order; rank counts strictly higher scores
+        return len(scores) - scores.bisect_left((score + 1, '')) + 1
+
+    def percentile(self, score: int, partition: str = 'all') -> float:
+        """Percentage of builds in the partition scoring below `score`"""
+        scores = self._partition(partition)
+        if not len(scores):
+            return 0.0
+        return scores.bisect_left((score, '')) / len(scores) * 100
+
+    def top_percent(self, score: int, partition: str = 'all') -> float:
+        """'Top X%' for a score already on the board: share of builds ranked at or above it"""
+        scores = self._partition(partition)
+        if not len(scores):
+            return 100.0
+        higher = len(scores) - scores.bisect_left((score + 1, ''))
+        return min(higher + 1, len(scores)) / len(scores) * 100
+
+    def top(self, percent: float, partition: str = 'all') -> List[Dict[str, Any]]:
+        """Builds in the top `percent` of the partition, highest score first"""
+        scores = self._partition(partition)
+        count = math.ceil(len(scores) * percent / 100)
+
+        results = []
+        for position, (score, build_id) in enumerate(scores.iter_descending()):
+            if position >= count:
+                break
+            results.append({'build_id': build_id, 'score': score, 'rating': get_rating(score)})
+        return results
+
+    def save(self, snapshot_file: str):
+        """Write a snapshot (atomic replace)"""
+        data = {
+            'version': SNAPSHOT_VERSION,
+            'partition_by_uma': self.partition_by_uma,
+            'partition_by_rating': self.partition_by_rating,
+            'entries': [[build_id, score, uma_id] for build_id, (score, uma_id) in self.entries.items()]
+        }
+        temp_file = snapshot_file + '.tmp'
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_file, snapshot_file)
+
+    @classmethod
+    def load(cls, snapshot_file: str) -> 'Leaderboard':
+        """Load a snapshot, bulk-building each partition with one sort"""
+        with open(snapshot_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        if data.get('version') != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version: {data.get('version')}")
+
+        board = cls(data['partition_by_uma'], data['partition_by_rating'])
+        grouped: Dict[str, List[Entry]] = {}
+        for build_id, score, uma_id in data['entries']:
+            board.entries[build_id] = (score, uma_id)
+            for name in board._partition_names(score, uma_id):
+                grouped.setdefault(name, []).append((score, build_id))
+
+        board.partitions = {name: SortedScores(entries) for name, entries in grouped.items()}
+        board.partitions.setdefault('all', SortedScores())
+        return board
+
+
+def load_uma_ids(root_dir: str) -> Dict[str, int]:
+    """Map Uma name (lowercase) -> id from uma_musume.json"""
+    with open(os.path.join(root_dir, 'assets', 'data', 'uma_musume.json'), 'r', encoding='utf-8') as f:
+        uma_data = json.load(f)
+    return {uma['name'].lower(): uma['id'] for uma in uma_data['uma_musume']}
+
+
+def parse_partition(args: List[str], root_dir: str) -> str:
+    """Turn --uma <name> / --rating <rating> options into a partition name"""
+    if '--uma' in args:
+        name = args[args.index('--uma') + 1]
+        uma_ids = load_uma_ids(root_dir)
+        if name.lower() not in uma_ids:
+            print(f"Error: Unknown Uma '{name}'")
+            sys.exit(1)
+        return f"uma:{uma_ids[name.lower()]}"
+    if '--rating' in args:
+        rating = args[args.index('--rating') + 1]
+        if rating not in RATINGS:
+            print(f"Error: Invalid rating '{rating}'. Must be one of: {', '.join(RATINGS)}")
+            sys.exit(1)
+        return f"rating:{rating}"
+    return 'all'
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("Usage:")
+        print("  Build:      python leaderboard.py build <archive> <snapshot>")
+        print("  Add:        python leaderboard.py add <snapshot> <build_id> <code>")
+        print("  Top:        python leaderboard.py top <snapshot> <percent> [--uma <name> | --rating <rating>]")
+        print("  Rank:       python leaderboard.py rank <snapshot> <build_id> [--uma <name> | --rating <rating>]")
+        print("  Percentile: python leaderboard.py percentile <snapshot> <score> [--uma <name> | --rating <rating>]")
+        print()
+        print("Archive format: one build per line, '<code>' or '<build_id>\\t<code>' (see build_codes.py)")
+        print()
+        print("Examples:")
+        print("  python leaderboard.py top board.json 3 --uma \"Agnes Tachyon\"")
+        print("  python leaderboard.py percentile board.json 15200 --rating S")
+        sys.exit(1)
+
+    command = sys.argv[1].lower()
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    libs_dir = os.path.dirname(script_dir)
+    root_dir = os.path.dirname(libs_dir)
+
+    if command == 'build':
+        if len(sys.argv) < 4:
+            print("Error: Build requires <archive> and <snapshot>")
+            sys.exit(1)
+
+        skills_by_id = load_skills_by_id(libs_dir)
+        skill_slugs = load_skill_slugs(libs_dir)
+        board = Leaderboard()
+
+        with open(sys.argv[2], 'r', encoding='utf-8') as f:
+            for build_id, build in read_archive(f, skill_slugs):
+                board.upsert(build_id, calculate_build_score(build, skills_by_id), build['uma_id'])
+
+        board.save(sys.argv[3])
+        print(f"✅ Leaderboard built with {len(board.entries)} builds → {sys.argv[3]}")
+
+    elif command == 'add':
+        if len(sys.argv) < 5:
+            print("Error: Add requires <snapshot>, <build_id> and <code>")
+            sys.exit(1)
+
+        snapshot_file = sys.argv[2]
+        board = Leaderboard.load(snapshot_file) if os.path.exists(snapshot_file) else Leaderboard()
+        try:
+            build = parse_build(sys.argv[4], load_skill_slugs(libs_dir))
+        except ValueError as e:
+            print(f"Error: Invalid build code: {e}")
+            sys.exit(1)
+        score = calculate_build_score(build, load_skills_by_id(libs_dir))
+        board.upsert(sys.argv[3], score, build['uma_id'])
+        board.save(snapshot_file)
+        print(f"✓ {sys.argv[3]}: {score} ({get_rating(score)}), rank {board.rank(sys.argv[3])}/{len(board.entries)}")
+
+    elif command in ('top', 'rank', 'percentile'):
+        if len(sys.argv) < 4:
+            print(f"Error: {command.capitalize()} requires <snapshot> and a value")
+            sys.exit(1)
+
+        board = Leaderboard.load(sys.argv[2])
+        partition = parse_partition(sys.argv[4:], root_dir)
+        size = len(board._partition(partition))
+
+        if command == 'top':
+            percent = float(sys.argv[3])
+            results = board.top(percent, partition)
+            print(f"🏆 Top {percent}% of {partition} ({len(results)} of {size} builds)")
+            for position, entry in enumerate(results, start=1):
+                print(f"   {position:>4}. {entry['build_id']}: {entry['score']} ({entry['rating']})")
+
+        elif command == 'rank':
+            build_id = sys.argv[3]
+            if build_id not in board.entries:
+                print(f"Error: Unknown build '{build_id}'")
+                sys.exit(1)
+            score, _ = board.entries[build_id]
+            try:
+                rank = board.rank(build_id, partition)
+            except ValueError as e:
+                print(f"Error: {e}")
+                sys.exit(1)
+            print(f"📊 {build_id}: {score} ({get_rating(score)}) - rank {rank}/{size} in {partition}")
+
+        else:
+            score = int(sys.argv[3])
+            print(f"📊 Score {score} in {partition}: beats {board.percentile(score, partition):.1f}% "
+                  f"(top {board.top_percent(score, partition):.1f}%) of {size} builds")
+
+    else:
+        print(f"Error: Unknown command '{command}'. Use 'build', 'add', 'top', 'rank' or 'percentile'")
+        sys.exit(1)